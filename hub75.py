@@ -146,6 +146,16 @@ class Hub75:
                                        sideset_base=Pin(latch_pin_start),
                                        freq=20_000_000)
         self.clearing = False
+
+        # Temporal dithering (off until dither() is called). dither_back holds
+        # the frames being drawn, dither_draw the completed set the refresh
+        # thread rotates through, one frame per full scan.
+        self.dither_back = None
+        self.dither_draw = None
+        self.dither_index = 0
+        self.dither_sets = None
+        self.dither_zero = None
+
         self.sm_data.active(1)
         self.sm_row.active(1)
        
@@ -174,9 +184,13 @@ class Hub75:
             row_index += 1
             if row_index >= self.num_rows:
                 row_index = 0
-                # copy draw buffer to frame
-                
-                self.frame_buffer= self.draw_buffer
+                # copy draw buffer to frame, or step to the next dither frame
+                frames = self.dither_draw
+                if frames:
+                    self.dither_index = (self.dither_index + 1) % len(frames)
+                    self.frame_buffer = frames[self.dither_index]
+                else:
+                    self.frame_buffer= self.draw_buffer
             
                
                 
@@ -193,6 +207,8 @@ class Hub75:
           - For y in 32..63 (bottom half): the pixel’s color occupies bits [3..5]
         Each horizontal block covers 4 pixels (4×6 bits = 24 bits per block).
         Colors are specified as r, g, b (each 0 or 1).
+        When dithering is on the pixel is also written into every dither
+        frame, so the drawing functions show at full brightness over it.
         """
         # Check bounds (optional)
         if not (0 <= x < 64 and 0 <= y < 64):
@@ -215,8 +231,68 @@ class Hub75:
         mask = 0b111 << bit_offset
         # Clear previous value and set the new color.
         self.back_buffer[index] = (self.back_buffer[index] & ~mask) | (color << bit_offset)
+        frames = self.dither_back
+        if frames:
+            for frame in frames:
+                frame[index] = (frame[index] & ~mask) | (color << bit_offset)
         
 
+    # 2x2 ordered dither phases (out of 4) so neighbouring pixels light on
+    # different frames; scaled to the frame count in set_pixel_dither()
+    DITHER_PHASE = (0, 2, 3, 1)
+
+    def dither(self, frames=4):
+        """
+        Enable temporal dithering with the given number of frames (0 disables).
+        The refresh thread shows one frame per scan, so each colour channel
+        gets frames+1 apparent levels with no extra work in the refresh loop.
+        Draw with set_pixel_dither() and publish with copy_back_buffer();
+        set_pixel() and the draw functions still work on top at full colour.
+        """
+        if frames < 2:
+            self.dither_back = None
+            self.dither_draw = None
+            self.dither_sets = None
+            self.dither_zero = None
+            return
+        # Two sets of frames, drawn into and shown in turn, plus one zero
+        # frame to clear from, so clear() never allocates while dithering.
+        self.dither_sets = [[array.array('I', [0] * self.buf_size) for _ in range(frames)]
+                            for _ in range(2)]
+        self.dither_zero = array.array('I', [0] * self.buf_size)
+        self.dither_back = self.dither_sets[0]
+        self.dither_draw = None
+        self.dither_index = 0
+
+    def set_pixel_dither(self, x, y, r, g, b):
+        """
+        Set the pixel at (x, y) in every dither frame. r, g, b are 0..255 and
+        are quantised to the number of dither frames; a channel at level v is
+        lit in v of the frames, offset by the pixel's 2x2 phase.
+        Uses the same buffer layout as set_pixel().
+        """
+        frames = self.dither_back
+        if not frames or not (0 <= x < 64 and 0 <= y < 64):
+            return
+
+        n = len(frames)
+        bit_offset = ((x % 4) * 6)
+        if y > 31:          # bottom half uses the upper 3 bits
+            y = y - 32
+            bit_offset += 3
+        index = (y-2) * self.blocks_per_row + (x >> 2)
+        mask = ~(0b111 << bit_offset)
+
+        r = (int(r) * n + 127) // 255
+        g = (int(g) * n + 127) // 255
+        b = (int(b) * n + 127) // 255
+        phase = self.DITHER_PHASE[((y & 1) << 1) | (x & 1)] * n // 4
+
+        for f in range(n):
+            t = (f + phase) % n
+            color = (r > t) | ((g > t) << 1) | ((b > t) << 2)
+            frames[f][index] = (frames[f][index] & mask) | (color << bit_offset)
+
     def draw_box(self,x,y,w,h,filled,r,g,b):
         if filled==0:
             for i in range(x,x+w):
@@ -385,9 +461,22 @@ class Hub75:
 
     def copy_back_buffer(self):
         self.draw_buffer= self.back_buffer
+        if self.dither_back:
+            self.dither_draw = self.dither_back
                     
     def clear(self):
         self.back_buffer = array.array('I', [0] * self.buf_size)
+        frames = self.dither_back
+        if frames:
+            # don't clear the set being shown, draw into the other one
+            if frames is self.dither_draw:
+                if frames is self.dither_sets[0]:
+                    frames = self.dither_sets[1]
+                else:
+                    frames = self.dither_sets[0]
+                self.dither_back = frames
+            for frame in frames:
+                frame[:] = self.dither_zero
  
             
             
@@ -0,0 +1,174 @@
+# hub75_host.py - host side helpers for hub75.py (CPython + NumPy, not for the pico)
+
+# Converts between a 64x64x3 image and the packed array('I') buffer that
+# Hub75.set_pixel() writes, so frames can be previewed, saved as PPM/PNG,
+# compared against golden images, or encoded on the host and streamed over.
+
+# Buffer layout (see Hub75.set_pixel):
+#   32 rows x 16 words, each word holds 4 pixels x 6 bits
+#   bits [0..2] of a pixel are the top half (y 0..31) as r,g,b
+#   bits [3..5] are the bottom half (y 32..63)
+#   screen row y is stored in buffer row (y % 32 - 2) % 32
+
+import array
+import re
+import struct
+import zlib
+
+import numpy as np
+
+WIDTH = 64
+HEIGHT = 64
+NUM_ROWS = 32
+BLOCKS_PER_ROW = 16
+ROW_OFFSET = 2
+
+# 2x2 ordered dither phases (out of 4); must match hub75.Hub75.DITHER_PHASE
+DITHER_PHASE = (0, 2, 3, 1)
+
+# P6 header: magic, width, height, maxval, then exactly one whitespace byte
+_PPM_HEADER = re.compile(rb'P6\s+(\d+)\s+(\d+)\s+(\d+)\s')
+
+# bit shift of every pixel inside its word, laid out as (half, row, block, pixel)
+_SHIFT = (np.arange(4, dtype=np.uint32) * 6 +
+          np.arange(2, dtype=np.uint32).reshape(2, 1, 1, 1) * 3)
+
+
+def decode(buf):
+    """
+    Unpack a Hub75 buffer (array('I'), bytes or ndarray of 512 words) into a
+    64x64x3 uint8 image with channels at 0 or 255.
+    """
+    if isinstance(buf, (bytes, bytearray, memoryview)):
+        # raw bytes, e.g. streamed content or array('I').tobytes()
+        words = np.frombuffer(buf, dtype=np.uintc)
+    else:
+        words = np.asarray(buf, dtype=np.uint32)
+    words = words.reshape(NUM_ROWS, BLOCKS_PER_ROW)
+    # undo the row offset so index 0 is screen row 0 / 32
+    words = np.roll(words, ROW_OFFSET, axis=0)
+    bits = (words[None, :, :, None] >> _SHIFT) & 0b111
+    bits = bits.reshape(HEIGHT, WIDTH)
+    rgb = (bits[..., None] >> np.arange(3, dtype=np.uint32)) & 1
+    return (rgb * 255).astype(np.uint8)
+
+
+def encode(img, threshold=128):
+    """
+    Pack a 64x64x3 image into a Hub75 buffer. Channels >= threshold are on.
+    Returns an array('I') ready to assign to display.back_buffer.
+    """
+    img = np.asarray(img)
+    if img.shape != (HEIGHT, WIDTH, 3):
+        raise ValueError("image must be 64x64x3")
+    on = (img >= threshold).astype(np.uint32)
+    color = on[..., 0] | (on[..., 1] << 1) | (on[..., 2] << 2)
+    return _pack(color)
+
+
+def encode_dither(img, frames=4):
+    """
+    Pack a 64x64x3 8-bit image into the list of frames Hub75.dither() uses,
+    matching Hub75.set_pixel_dither(). Assign the result to
+    display.dither_back and call copy_back_buffer().
+    """
+    img = np.asarray(img)
+    if img.shape != (HEIGHT, WIDTH, 3):
+        raise ValueError("image must be 64x64x3")
+    if frames < 2:
+        raise ValueError("frames must be at least 2")
+    level = (img.astype(np.uint32) * frames + 127) // 255
+    y, x = np.indices((HEIGHT, WIDTH))
+    phase = np.array(DITHER_PHASE, dtype=np.uint32)[((y & 1) << 1) | (x & 1)]
+    phase = phase * frames // 4
+    out = []
+    for f in range(frames):
+        t = ((f + phase) % frames)[..., None]
+        on = (level > t).astype(np.uint32)
+        out.append(_pack(on[..., 0] | (on[..., 1] << 1) | (on[..., 2] << 2)))
+    return out
+
+
+def _pack(color):
+    # 64x64 of 3-bit colors -> (half, row, block, pixel); fields never overlap
+    # so summing the shifted values is the same as or-ing them together
+    fields = color.astype(np.uint32).reshape(2, NUM_ROWS, BLOCKS_PER_ROW, 4) << _SHIFT
+    words = fields.sum(axis=(0, 3), dtype=np.uint32)
+    words = np.roll(words, -ROW_OFFSET, axis=0)
+    # np.uintc is C unsigned int, the same item as array('I')
+    return array.array('I', words.astype(np.uintc).tobytes())
+
+
+def save_ppm(path, img):
+    """
+    Write a 64x64x3 image (or a Hub75 buffer) as a binary PPM.
+    """
+    img = _as_image(img)
+    with open(path, 'wb') as f:
+        f.write(b'P6\n%d %d\n255\n' % (img.shape[1], img.shape[0]))
+        f.write(img.tobytes())
+
+
+def load_ppm(path):
+    """
+    Read a binary PPM written by save_ppm() back into an HxWx3 uint8 image.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    # pixels start right after the single whitespace byte ending the header;
+    # pixel bytes may themselves look like whitespace
+    m = _PPM_HEADER.match(data)
+    if not m or int(m.group(3)) != 255:
+        raise ValueError("not an 8-bit binary PPM")
+    w, h = int(m.group(1)), int(m.group(2))
+    size = w * h * 3
+    if len(data) - m.end() != size:
+        raise ValueError("PPM has %d pixel bytes, expected %d" % (len(data) - m.end(), size))
+    pixels = np.frombuffer(data, dtype=np.uint8, offset=m.end())
+    return pixels.reshape(h, w, 3)
+
+
+def save_png(path, img, scale=1):
+    """
+    Write a 64x64x3 image (or a Hub75 buffer) as an RGB PNG, optionally
+    scaled up by an integer factor for easier viewing.
+    """
+    img = _as_image(img)
+    if scale > 1:
+        img = img.repeat(scale, axis=0).repeat(scale, axis=1)
+    h, w = img.shape[:2]
+    # every scanline is prefixed with filter type 0
+    raw = np.zeros((h, w * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = img.reshape(h, w * 3)
+
+    def chunk(kind, body):
+        return (struct.pack('>I', len(body)) + kind + body +
+                struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes())))
+        f.write(chunk(b'IEND', b''))
+
+
+def compare(img, golden):
+    """
+    Return the number of pixels that differ between two images (or Hub75
+    buffers); 0 means they match.
+    """
+    a = _as_image(img)
+    b = _as_image(golden)
+    if a.shape != b.shape:
+        raise ValueError("image sizes differ")
+    return int(np.count_nonzero((a != b).any(axis=2)))
+
+
+def _as_image(img):
+    # accept either a decoded image or a raw buffer
+    if isinstance(img, (array.array, bytes, bytearray, memoryview)):
+        return decode(img)
+    img = np.asarray(img)
+    if img.ndim == 1:
+        return decode(img)
+    return img.astype(np.uint8)
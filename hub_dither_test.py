@@ -0,0 +1,22 @@
+from hub75 import Hub75
+
+# Create an instance of the Hub75 display.
+display = Hub75()
+
+# Temporal dithering: 4 frames gives 5 levels per channel.
+# The refresh thread shows a different frame on each scan.
+display.dither(4)
+
+try:
+    while True:
+        display.clear() # clear back buffer and dither frames
+        for y in range(64):
+            for x in range(64):
+                display.set_pixel_dither(x,y,x*4,y*4,255-x*4) # x,y,r,g,b (0 - 255)
+        # normal drawing still works over the dithered pixels at full colour
+        display.draw_box(14,27,38,11,1,0,0,0) # x,y,width,height,filled (0 or 1), r,g,b
+        display.draw_text(15,29,"font_8x5","DITHER",1,1,1) # x,y,font to use,text to draw, r,g,b
+        display.copy_back_buffer() # copy back buffer and dither frames to the display
+
+except KeyboardInterrupt:
+    display.dither(0)
@@ -0,0 +1,208 @@
+# Golden-image and round trip tests for hub75_host.py, run on the host with
+# pytest. rp2 and machine only exist on the pico, so they are replaced with
+# small stand-ins and the refresh thread is never started.
+#
+# Regenerate the golden images after an intended drawing change with:
+#   HUB75_UPDATE_GOLDEN=1 python -m pytest tests
+
+import os
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN = os.path.join(ROOT, "tests", "golden")
+sys.path.insert(0, ROOT)
+
+
+class _StateMachine:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def active(self, value):
+        pass
+
+    def put(self, value):
+        pass
+
+
+if "rp2" not in sys.modules:
+    rp2 = types.ModuleType("rp2")
+    rp2.asm_pio = lambda **kwargs: (lambda program: program)
+    rp2.PIO = types.SimpleNamespace(OUT_LOW=0, OUT_HIGH=1)
+    rp2.StateMachine = _StateMachine
+    sys.modules["rp2"] = rp2
+if "machine" not in sys.modules:
+    machine = types.ModuleType("machine")
+    machine.Pin = lambda pin: pin
+    sys.modules["machine"] = machine
+
+import hub75  # noqa: E402
+import hub75_host  # noqa: E402
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.setattr(hub75._thread, "start_new_thread", lambda func, args: None)
+    d = hub75.Hub75()
+    d.clear()
+    return d
+
+
+def _gradient():
+    y, x = np.indices((64, 64))
+    return np.stack([x * 4, y * 4, 255 - x * 4], axis=2).astype(np.uint8)
+
+
+def _check_golden(name, buf):
+    path = os.path.join(GOLDEN, name + ".ppm")
+    if os.environ.get("HUB75_UPDATE_GOLDEN"):
+        os.makedirs(GOLDEN, exist_ok=True)
+        hub75_host.save_ppm(path, buf)
+    assert hub75_host.compare(buf, hub75_host.load_ppm(path)) == 0
+
+
+def test_draw_box_outline(display):
+    display.draw_box(14, 39, 38, 11, 0, 1, 0, 1)
+    _check_golden("draw_box_outline", display.back_buffer)
+
+
+def test_draw_box_filled(display):
+    display.draw_box(4, 20, 30, 20, 1, 1, 1, 0)
+    expected = np.zeros((64, 64, 3), dtype=np.uint8)
+    expected[20:40, 4:34] = (255, 255, 0)
+    assert hub75_host.compare(display.back_buffer, expected) == 0
+    _check_golden("draw_box_filled", display.back_buffer)
+
+
+def test_draw_line(display):
+    display.draw_line(32, 32, 56, 18, 0, 1, 0)
+    display.draw_line(32, 32, 36, 8, 0, 1, 1)
+    display.draw_line(0, 63, 63, 0, 1, 0, 0)
+    _check_golden("draw_line", display.back_buffer)
+
+
+def test_draw_circle(display):
+    display.draw_circle(31, 31, 31, 0, 0, 1)
+    display.draw_circle(20, 40, 10, 1, 0, 1)
+    _check_golden("draw_circle", display.back_buffer)
+
+
+def test_draw_text(display):
+    display.draw_text(15, 41, "font_8x5", "HUB 75 :)", 1, 1, 1, 0, 0)
+    display.draw_text(2, 2, "font_8x5", "12:22", 1, 1, 1, 0, 2)
+    _check_golden("draw_text", display.back_buffer)
+
+
+def test_encode_matches_set_pixel(display):
+    img = np.random.default_rng(1).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    for y in range(64):
+        for x in range(64):
+            display.set_pixel(x, y, *(img[y, x] >= 128))
+    assert hub75_host.encode(img) == display.back_buffer
+
+
+def test_encode_decode_round_trip():
+    img = np.random.default_rng(2).integers(0, 2, (64, 64, 3), dtype=np.uint8) * 255
+    buf = hub75_host.encode(img)
+    assert len(buf) == 512
+    assert np.array_equal(hub75_host.decode(buf), img)
+    assert hub75_host.encode(hub75_host.decode(buf)) == buf
+
+
+@pytest.mark.parametrize("frames", [2, 3, 4, 8])
+def test_encode_dither_matches_set_pixel_dither(display, frames):
+    img = _gradient()
+    display.dither(frames)
+    for y in range(64):
+        for x in range(64):
+            display.set_pixel_dither(x, y, *img[y, x])
+    assert hub75_host.encode_dither(img, frames) == display.dither_back
+
+
+def test_encode_dither_averages_to_input():
+    img = _gradient()
+    frames = hub75_host.encode_dither(img, 4)
+    mean = np.mean([hub75_host.decode(f) for f in frames], axis=0)
+    assert np.abs(mean - img).max() <= 255 / 8 + 1
+
+
+def test_dither_phase_matches_device():
+    assert hub75_host.DITHER_PHASE == hub75.Hub75.DITHER_PHASE
+
+
+def test_set_pixel_draws_into_dither_frames(display):
+    display.dither(4)
+    display.draw_box(0, 0, 8, 8, 1, 1, 0, 0)
+    expected = np.zeros((64, 64, 3), dtype=np.uint8)
+    expected[0:8, 0:8] = (255, 0, 0)
+    for frame in display.dither_back:
+        assert hub75_host.compare(frame, expected) == 0
+
+
+def test_dither_clear_reuses_frames(display):
+    display.dither(4)
+    first = display.dither_back
+    arrays = [id(f) for f in first]
+    display.set_pixel_dither(5, 5, 255, 255, 255)
+    display.copy_back_buffer()
+    display.clear()
+    second = display.dither_back
+    assert second is not first
+    assert display.dither_draw is first
+    assert all(not any(f) for f in second)
+    assert all(any(f) for f in first)
+    display.copy_back_buffer()
+    display.clear()
+    assert display.dither_back is first
+    assert [id(f) for f in display.dither_back] == arrays
+    assert all(not any(f) for f in first)
+
+
+def test_ppm_round_trip_with_whitespace_bytes(tmp_path):
+    img = np.zeros((64, 64, 3), dtype=np.uint8)
+    img[0, 0] = (10, 32, 9)
+    img[0, 1] = (13, 12, 11)
+    path = str(tmp_path / "ws.ppm")
+    hub75_host.save_ppm(path, img)
+    assert np.array_equal(hub75_host.load_ppm(path), img)
+
+
+def test_load_ppm_rejects_wrong_length(tmp_path):
+    path = str(tmp_path / "cut.ppm")
+    hub75_host.save_ppm(path, _gradient())
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-10])
+    with pytest.raises(ValueError):
+        hub75_host.load_ppm(path)
+    with open(path, "wb") as f:
+        f.write(data + b"\0")
+    with pytest.raises(ValueError):
+        hub75_host.load_ppm(path)
+
+
+def test_decode_bytes():
+    img = _gradient()
+    buf = hub75_host.encode(img)
+    raw = buf.tobytes()
+    assert np.array_equal(hub75_host.decode(raw), hub75_host.decode(buf))
+    assert hub75_host.compare(bytearray(raw), buf) == 0
+    assert hub75_host.compare(memoryview(raw), buf) == 0
+
+
+@pytest.mark.parametrize("frames", [0, 1])
+def test_encode_dither_rejects_too_few_frames(frames):
+    with pytest.raises(ValueError):
+        hub75_host.encode_dither(_gradient(), frames)
+
+
+def test_save_png(tmp_path):
+    path = str(tmp_path / "frame.png")
+    hub75_host.save_png(path, hub75_host.encode(_gradient()), scale=4)
+    with open(path, "rb") as f:
+        assert f.read(8) == b"\x89PNG\r\n\x1a\n"